@@ -68,6 +68,10 @@ def connect(logger, schema: DeclarativeMeta, conn_string: str = '',
 
     # noinspection PyUnresolvedReferences
     schema.metadata.create_all(engine)
+    # create_all skips existing tables along with their indexes; add any index declared since
+    for table in schema.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(engine, checkfirst=True)
     log.info(f'mapped {_connection} schema')
 
     @contextmanager
@@ -34,6 +34,7 @@ __all__ = [
     'text_patrick',
     'test_nom_tol',
     'dict_from',
+    'make_dict_from',
     'set_from',
     'WorkingDirectory',
 ]
@@ -58,6 +59,17 @@ def dict_from(obj, keys: Iterable[str]) -> Dict[str, Any]:
     return {k: getattr(obj, k) for k in keys}
 
 
+def make_dict_from(keys: Iterable[str]) -> Callable[[Any], Dict[str, Any]]:
+    """
+    specialize dict_from for a fixed set of keys
+    the generated function is a single dict display of inlined attribute loads
+    """
+    items = ', '.join(f'{k!r}: obj.{k}' for k in keys)
+    namespace: Dict[str, Any] = {}
+    exec(f'def _dict_from(obj):\n    return {{{items}}}\n', namespace)
+    return namespace['_dict_from']
+
+
 def set_from(src, dst: _T, keys: Iterable[str]) -> _T:
     [setattr(dst, k, getattr(src, k)) for k in keys]
     return dst
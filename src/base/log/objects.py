@@ -207,12 +207,12 @@ class Handler:
 
         def flush_cache_to_db(self) -> None:
             with self._session_manager() as session:
-                session.add_all(self._records)
+                self._log_record.bulk_insert(session, self._records)
             self.clear_cache()
             self.make_next_emit()
 
         def add_record_to_cache(self, record: logging.LogRecord) -> None:
-            self._records.append(self._log_record.from_record(record, self._id))
+            self._records.append(self._log_record.mapping_from_record(record, self._id))
             self._cache_size += 1
 
         def clear_cache(self) -> None:
@@ -3,12 +3,18 @@ declarative models should inherit from (meta.Base, meta.TableMixin)
 default factories should be declared in helper.py
 """
 
+from itertools import islice
+from typing import Any
+from typing import Dict
+from typing import Iterable
+
 from sqlalchemy import Column
 from sqlalchemy import DateTime
+from sqlalchemy import Index
 from sqlalchemy import Integer
 from sqlalchemy import String
 
-from src.base.general import dict_from
+from src.base.general import make_dict_from
 from src.base.db.meta import *
 
 __all__ = [
@@ -46,16 +52,33 @@ class Log(Schema):
 class LogRecord(Schema):
     _repr_fields = ['created', 'levelname', 'name', 'message', ]
     _keys = ['levelno', 'levelname', 'name', 'lineno', 'created_dt', 'msg', 'processName']
+    _extract_fields = staticmethod(make_dict_from(_keys))
+    __table_args__ = (Index('ix_logrecord_session_created', 'session_id', 'created_dt'),)
     levelno = Column(Integer, nullable=False)
-    processName = Column(String(16), nullable=False)
+    processName = Column(String, nullable=False)
     levelname = Column(String(8), nullable=False)
-    name = Column(String(256), nullable=False)
+    name = Column(String, nullable=False)
     lineno = Column(Integer, nullable=False)
     created_dt = Column(DateTime, nullable=False)
     msg = Column(String(512), nullable=False)
     session_id = Log.id_fk()
     session = Rel.session_to_log_records.child
 
+    @classmethod
+    def mapping_from_record(cls, record, session_id: int = None) -> Dict[str, Any]:
+        mapping = cls._extract_fields(record)
+        mapping['session_id'] = session_id
+        return mapping
+
     @classmethod
     def from_record(cls, record, session_id: int = None) -> 'LogRecord':
-        return LogRecord(**dict_from(record, cls._keys), session_id=session_id)
+        return cls(**cls.mapping_from_record(record, session_id))
+
+    @classmethod
+    def bulk_insert(cls, session, mappings: Iterable[Dict[str, Any]], batch: int = 1000) -> None:
+        """
+        insert rows made by mapping_from_record as executemany batches without per-row ORM state
+        """
+        mappings = iter(mappings)  # any iterable, including the handler's deque, which can't be sliced
+        for chunk in iter(lambda: list(islice(mappings, batch)), []):
+            session.bulk_insert_mappings(cls, chunk)
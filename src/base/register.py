@@ -88,7 +88,7 @@ def _get_from_registry(cls: type):
 
     for cla in reversed(cls.__mro__[:-1]):
 
-        existing = getattr(cla, _class_registry_key, None)
+        existing = vars(cla).get(_class_registry_key, None)
         if isinstance(existing, defaultdict):
             for wrapped_method, method_d in existing.items():
                 for order_key, registered_fs in method_d.items():
@@ -103,7 +103,7 @@ def _get_from_registry(cls: type):
                         for wrapped_method in wrapped_methods:
                             cls_method_registry[wrapped_method][order_key].add(name)
 
-    getattr(cls, _class_registry_key, cls_method_registry)
+    setattr(cls, _class_registry_key, cls_method_registry)
     return cls_method_registry
 
 
@@ -147,9 +147,16 @@ def _wrap_methods_with_registered_functions(cls: type) -> None:
         setattr(cls, wrapped_method_name, _wrapper_factory(to_be_wrapped, registered_d))
 
 
+def _has_registered_functions(cls: type) -> bool:
+    return any(isinstance(getattr(f, _function_registry_key, None), dict) for f in vars(cls).values())
+
+
 class Mixin:
     """see module documentation"""
 
     def __init_subclass__(cls) -> None:
-        _wrap_methods_with_registered_functions(cls)
+        # a subclass that adds no hooks beneath bases that have none inherits its methods as-is
+        inherits_hooks = any(getattr(base, _class_registry_key, None) for base in cls.__bases__)
+        if inherits_hooks or _has_registered_functions(cls):
+            _wrap_methods_with_registered_functions(cls)
         super().__init_subclass__()
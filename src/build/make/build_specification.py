@@ -20,7 +20,19 @@ __all__ = [
 ]
 
 # TODO: sources copied to matplotlib/mpl-data, overwriting actual mpl-data
-# TODO: nothing on google, possibly cwd problem, not investigated
+
+# noinspection SpellCheckingInspection
+_DISCRETIONARY_ARGS = (('--clean', 'DO_CLEAN'),
+                       ('--specpath=%s', 'SPEC_PATH'),
+                       ('--log-level=%s', '_LOG_LEVEL'),
+                       ('--key=%s', '_KEY'),
+                       ('--icon=%s', 'ICON_PATH'),
+                       ('--debug=%s', '_DEBUG'),
+                       ('--add-data=%s', '_ADDITIONAL_DATA'),
+                       ('--add-binary=%s', '_ADDITIONAL_BINARIES'),
+                       ('--hidden-import=%s', 'HIDDEN_IMPORTS'),
+                       ('--upx-exclude=%s', 'UPX_EXCLUDE'),
+                       ('--exclude-module=%s', 'EXCLUDED_MODULES'),)
 
 
 class BuildSpecification:
@@ -90,9 +102,9 @@ class BuildSpecification:
             return f'{source};{source}'
 
     def _make_paths(self):
-        self._APPLICATION_ENTRY_POINT = self.APPLICATION_ENTRY_POINT + '.py'
         self._PROJECT_PATH: Path = self.PROJECT_PATH
         self.SPEC_PATH: Path = self._PROJECT_PATH / 'src'
+        self._APPLICATION_ENTRY_POINT = str(self.SPEC_PATH / (self.APPLICATION_ENTRY_POINT + '.py'))
         build_path = self._PROJECT_PATH / 'build'
         self.DESTINATION_PATH: Path = build_path / 'bin'
         self.WORKING_PATH: Path = build_path / 'dat'
@@ -147,7 +159,7 @@ class BuildSpecification:
         return is_good
 
     def _make_includes(self):
-        self.__ADDITIONAL_FILES_OR_DIRS: List[str] = list(
+        self._ADDITIONAL_DATA: List[str] = list(
             map(self.make_resource_paths, self._ADDITIONAL_FILES_OR_DIRS))
         self._ADDITIONAL_BINARIES: List[str] = list(map(self.make_resource_paths, self.ADDITIONAL_BINARIES))
 
@@ -166,16 +178,17 @@ class BuildSpecification:
             exit()
         self.make_resource_dir()
         self._make_includes()
+        self._args = self._make_args()
 
     @property
     def _required_args(self) -> List[str]:
         # noinspection SpellCheckingInspection
-        return ['--name=%s' % self.APPLICATION_NAME,
+        return [f'--name={self.APPLICATION_NAME}',
                 '--onefile' if self.ONE_FILE else '--onedir',
                 '--noconfirm',
                 r'--upx-dir=C:\upx_dir',
-                '--distpath=%s' % self.DESTINATION_PATH,
-                '--workpath=%s' % self.WORKING_PATH,
+                f'--distpath={self.DESTINATION_PATH}',
+                f'--workpath={self.WORKING_PATH}',
                 '--console' if self.KEEP_CONSOLE else '--windowed', ]
 
     @staticmethod
@@ -191,46 +204,34 @@ class BuildSpecification:
 
     @property
     def _discretionary_args(self) -> List[str]:
-        # noinspection SpellCheckingInspection
-        _DISCRETIONARY_ARGS = (('--clean', self.DO_CLEAN),
-                               ('--specpath=%s', self.SPEC_PATH),
-                               ('--log-level=%s', self._LOG_LEVEL),
-                               ('--key=%s', self._KEY),
-                               ('--icon=%s', self.ICON_PATH),
-                               ('--debug=%s', self._DEBUG),
-                               ('--add-data=%s', self.__ADDITIONAL_FILES_OR_DIRS),
-                               ('--add-binary=%s', self._ADDITIONAL_BINARIES),
-                               ('--hidden-import=%s', self.HIDDEN_IMPORTS),
-                               ('--upx-exclude=%s', self.UPX_EXCLUDE),
-                               ('--exclude-module=%s', self.EXCLUDED_MODULES),)
-        return list(chain(*[self._discretionary(k, v) for k, v in _DISCRETIONARY_ARGS]))
+        return list(chain.from_iterable(self._discretionary(k, getattr(self, attr))
+                                        for k, attr in _DISCRETIONARY_ARGS))
 
-    def args(self) -> List[str]:
+    def _make_args(self) -> List[str]:
         args = list(chain(self._required_args, self._discretionary_args))
         if self.HOOKS:
-            args += ["--additional-hooks-dir=%s" % self._HOOKS_DIR]
+            args += [f'--additional-hooks-dir={self._HOOKS_DIR}']
         if not self.UPX_COMPRESS:
             args += [r'--noupx']
         args += [self._APPLICATION_ENTRY_POINT]
         return args
 
+    def args(self) -> List[str]:
+        return self._args
+
     def make_hooks(self):
-        try:
-            os.remove(self._HOOKS_DIR)
-        except IOError:
-            pass
+        shutil.rmtree(self._HOOKS_DIR, ignore_errors=True)
         if self.HOOKS:
             os.makedirs(self._HOOKS_DIR, exist_ok=True)
             for explicit_import, implicit_imports in self.HOOKS.items():
-                with open(str(self._HOOKS_DIR / explicit_import / '.py'), 'w+') as hook_file:
-                    hook_file.write('')
-                    # noinspection SpellCheckingInspection
-                    hook_file.write(
-                        'hiddenimports = [' + ','.join([f'"{imp}"' for imp in implicit_imports]) + ']')
+                # noinspection SpellCheckingInspection
+                (self._HOOKS_DIR / f'hook-{explicit_import}.py').write_text(
+                    'hiddenimports = [' + ','.join(f'"{imp}"' for imp in implicit_imports) + ']'
+                )
 
     def cleanup_hooks(self):
         if self.HOOKS:
-            os.remove(self._HOOKS_DIR)
+            shutil.rmtree(self._HOOKS_DIR, ignore_errors=True)
 
     def cleanup_spec(self):
         try:
@@ -284,7 +285,6 @@ class BuildSpecification:
                 return print('\nDID NOT BUILD')
 
         build_spec.make_hooks()
-        os.chdir(build_spec.SPEC_PATH)
 
         ti = datetime.now()
         build_spec.update_build_name(build_spec.APPLICATION_NAME)
@@ -311,10 +311,5 @@ class BuildSpecification:
 
     @classmethod
     def make(cls, build) -> None:
-        version = build.update_build_version_number()
-        start_dir = os.getcwd()
-        os.chdir(r'/')
-        try:
-            build._make(version)
-        finally:
-            os.chdir(start_dir)
+        # every path handed to PyInstaller is absolute, so the build does not depend on the cwd
+        build._make(build.update_build_version_number())
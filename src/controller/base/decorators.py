@@ -4,20 +4,70 @@ from enum import auto
 from enum import Enum
 from typing import *
 
-from src.base.general import setdefault_attr_from_factory
-from src.base.general import setdefault_attr_from_mro_or_factory
 from src.controller.base.enums import SubscribeTo
 
 __all__ = [
     'scan_method',
     'subscribe',
     'SubscribeTo',
+    'RegisteredMethods',
 ]
 
 _T = TypeVar('_T', bound=Callable)
 _DT = TypeVar('_DT', bound=type)
 
 _scan_methods_key = 'scan_methods'
+_scan_methods_local_key = '_scan_methods_local_'
+
+
+_GLOBAL_FLAGS = re.compile(r'^\(\?[aiLmsux]+\)')
+_SCOPED_FLAGS = (
+    (re.ASCII, 'a'), (re.IGNORECASE, 'i'), (re.MULTILINE, 'm'), (re.DOTALL, 's'), (re.VERBOSE, 'x'),
+)
+_BACKREFERENCE = re.compile(r'(?<!\\)(?:\\\\)*\\[1-9]|\(\?P=')
+
+
+def _scoped_pattern(pattern: re.Pattern) -> str:
+    """
+    move a pattern's global flags into a scoped group so it can be alternated with others
+    raise for what would change meaning once alternated: locale flag, backreferences, named groups
+    """
+    if pattern.flags & re.LOCALE:
+        raise ValueError(f'scan pattern {pattern.pattern!r} uses re.LOCALE, which cannot be scoped')
+    if pattern.groupindex:
+        raise ValueError(f'scan pattern {pattern.pattern!r} has named groups; use plain groups')
+    if _BACKREFERENCE.search(pattern.pattern):
+        raise ValueError(f'scan pattern {pattern.pattern!r} has backreferences; group numbers shift')
+    body = _GLOBAL_FLAGS.sub('', pattern.pattern, count=1)
+    flags = ''.join(c for flag, c in _SCOPED_FLAGS if pattern.flags & flag)
+    return f'(?{flags}:{body})' if flags else body
+
+
+def _combine_scan_patterns(
+        scan_methods: Tuple[Tuple[str, re.Pattern], ...]
+) -> Tuple[Optional[re.Pattern], Dict[str, slice]]:
+    """
+    one alternation with a group named for each scan method wrapping that method's pattern
+    and the slice of the combined match's groups() that holds each method's own groups
+    """
+    if not scan_methods:
+        return None, {}
+    combined = re.compile('|'.join(
+        f'(?P<{name}>{_scoped_pattern(pattern)})' for name, pattern in scan_methods
+    ))
+    return combined, {
+        name: slice(combined.groupindex[name], combined.groupindex[name] + pattern.groups)
+        for name, pattern in scan_methods
+    }
+
+
+def _class_local(owner: type, k: str, factory: Callable[[], _T]) -> _T:
+    """
+    get or create a registry that lives only in owner's own namespace
+    """
+    if k not in vars(owner):
+        setattr(owner, k, factory())
+    return vars(owner)[k]
 
 
 class _ScanMethod(Generic[_T]):
@@ -26,10 +76,8 @@ class _ScanMethod(Generic[_T]):
         self._pattern = pattern
 
     def __set_name__(self, owner, name):
-        setdefault_attr_from_mro_or_factory(
-            owner, _scan_methods_key, list
-        ).append((name, self._pattern))
-        setattr(owner, name, self._f.__get__(owner))
+        _class_local(owner, _scan_methods_local_key, list).append((name, self._pattern))
+        setattr(owner, name, self._f)
 
     def __get__(self, instance, owner) -> _T:
         pass
@@ -43,6 +91,7 @@ def scan_method(pattern: re.Pattern) -> Callable[[_T], _ScanMethod[_T]]:
 
 
 _subscribed_methods_key = 'subscribed_methods'
+_subscribed_methods_local_key = '_subscribed_methods_local_'
 
 
 class _Subscribed(Generic[_T]):
@@ -52,10 +101,9 @@ class _Subscribed(Generic[_T]):
         self._target = target
 
     def __set_name__(self, owner, name):
+        local = _class_local(owner, _subscribed_methods_local_key, lambda: defaultdict(dict))
         for message_type in self._message_types:
-            setdefault_attr_from_factory(
-                owner, _subscribed_methods_key, lambda : defaultdict(dict)
-            )[self._target][message_type] = self._f.__name__
+            local[self._target][message_type] = self._f.__name__
         self._name = name
 
     def __get__(self, instance, owner) -> _T:
@@ -69,3 +117,30 @@ def subscribe(*cla: Type, target: SubscribeTo = SubscribeTo.VIEW) -> Callable[[_
         return _Subscribed(f, *cla, target=target)
 
     return inner
+
+
+class RegisteredMethods:
+    """
+    merges the class-local scan_method and subscribe registries of the mro
+    into scan_methods and subscribed_methods once, when the subclass is created
+    scan_pattern matches any scan method's pattern; its lastgroup keys scan_dispatch
+    scan_dispatch holds the plain function and its groups() slice for each scan method
+    """
+    scan_methods: Tuple[Tuple[str, re.Pattern], ...] = ()
+    scan_pattern: Optional[re.Pattern] = None
+    scan_dispatch: Dict[str, Tuple[Callable, slice]] = {}
+    subscribed_methods: DefaultDict[SubscribeTo, Dict[Type, str]]
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        scan_methods: Dict[str, re.Pattern] = {}
+        subscribed_methods: DefaultDict[SubscribeTo, Dict[Type, str]] = defaultdict(dict)
+        for cla in reversed(cls.__mro__):
+            namespace = vars(cla)
+            scan_methods.update(namespace.get(_scan_methods_local_key, ()))
+            for target, methods in namespace.get(_subscribed_methods_local_key, {}).items():
+                subscribed_methods[target].update(methods)
+        setattr(cls, _scan_methods_key, tuple(scan_methods.items()))
+        cls.scan_pattern, scan_groups = _combine_scan_patterns(getattr(cls, _scan_methods_key))
+        cls.scan_dispatch = {name: (getattr(cls, name), groups) for name, groups in scan_groups.items()}
+        setattr(cls, _subscribed_methods_key, subscribed_methods)
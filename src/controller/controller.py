@@ -1,19 +1,28 @@
 import datetime
+import logging
 import re
-from dataclasses import asdict
+from dataclasses import fields
 from queue import Queue
 from random import randint
 from typing import *
 
+from sqlalchemy import and_
+from sqlalchemy import case
+from sqlalchemy import func
 from sqlalchemy.orm import joinedload
+from sqlalchemy.orm import load_only
+from sqlalchemy.orm import selectinload
 
 from src.base import atexit_proxy
 from src.base.concurrency.concurrency import *
 from src.base.log import logger
+from src.controller.base.decorators import RegisteredMethods
 from src.controller.base.decorators import scan_method
 from src.controller.base.decorators import subscribe
 from src.controller.base.enums import SubscribeTo
 from src.model.db import connect
+from src.model.db.schema import EEPROMConfigIteration
+from src.model.db.schema import FirmwareIteration
 from src.model.db.schema import LightingDUT
 from src.model.db.schema import LightingStation3Iteration
 from src.model.db.schema import LightingStation3ResultRow
@@ -34,6 +43,7 @@ __all__ = [
 
 log = logger(__name__)
 
+_ONE_HOUR = datetime.timedelta(hours=1)
 TEST_RUN_D_T = Dict[str, Union[int, bool, datetime.datetime, str, str]]
 _sns = [str(randint(2 ** 23, 2 ** 24 - 1)).zfill(8) for _ in range(5)]
 
@@ -48,9 +58,7 @@ _sns = [str(randint(2 ** 23, 2 ** 24 - 1)).zfill(8) for _ in range(5)]
 #     )
 
 
-class Controller(Process):
-    scan_methods: List[Tuple[str, re.Pattern]]
-    subscribed_methods: DefaultDict[SubscribeTo, Dict[Type, str]]
+class Controller(Process, RegisteredMethods):
     iteration_t: Type
     _station_mode: StationMode
     _iteration_cla: Type[LightingStation3Iteration] = LightingStation3Iteration
@@ -74,36 +82,35 @@ class Controller(Process):
 
     @subscribe(ScanMessage)
     def scan(self, scan_string: str) -> None:
-        for f, pattern in self.scan_methods or []:
-            parsed = pattern.findall(scan_string)
-            if parsed:
-                log.info(f'handling scan -> {f}{tuple(parsed[0])}')
-                return getattr(self, f)(*parsed[0])
+        match = self.scan_pattern and self.scan_pattern.match(scan_string)
+        if match:
+            f = match.lastgroup
+            method, groups = self.scan_dispatch[f]
+            parsed = match.groups()[groups]
+            log.info(f'handling scan -> {f}{parsed}')
+            return method(self, *parsed)
 
         log.info(f'unhandled scan -> {scan_string}')
 
-    def _make_one_history_entery(self, result) -> HistoryAddEntryMessage:
-        return HistoryAddEntryMessage(
-            result.id, bool(result.pf), result.created_at,
-            f'10-{str(result.dut.mn).zfill(5)}', str(result.dut.sn).zfill(8),
-        )
-
     @subscribe(HistoryGetAllMessage)
     def get_history(self) -> None:
         with self.session_manager() as session:
-            results: List[LightingStation3Iteration] = session.query(self._iteration_cla).options(
-                joinedload(self._iteration_cla.dut)
-            ).order_by(self._iteration_cla.created_at).limit(100).all()
-
-            # noinspection PyTypeChecker
-            return self.publish(HistorySetAllMessage(
-                list(map(self._make_one_history_entery, results))
-            ))
+            iteration_t, dut_t = self._iteration_cla, self._dut_cla
+            results: List[LightingStation3Iteration] = session.query(iteration_t).options(
+                load_only(iteration_t.id, iteration_t.pf, iteration_t.created_at, iteration_t.dut_id),
+                selectinload(iteration_t.dut).load_only(dut_t.mn_formatted, dut_t.sn_formatted),
+            ).order_by(iteration_t.created_at.desc()).limit(100).all()
+
+            entry = HistoryAddEntryMessage
+            return self.publish(HistorySetAllMessage([
+                entry(r.id, bool(r.pf), r.created_at, r.dut.mn_formatted, r.dut.sn_formatted)
+                for r in results
+            ]))
 
     @subscribe(ModeChangeMessage)
     def mode_change(self, mode: StationMode):
         if not self.is_testing:
-            if mode == StationMode.REWORK:
+            if mode is StationMode.REWORK:
                 self.publish(InstructionMessage('not in test mode', 'scan DUT to view results'))
             else:
                 self.publish(InstructionMessage('ready to test', 'scan DUT to continue'))
@@ -123,11 +130,16 @@ class Controller(Process):
         self.test_station.send_test_instrument_names()
 
         with self.session_manager(expire=False) as session:
-            iteration: LightingStation3Iteration = session.query(LightingStation3Iteration).first()
-            _ = [f.firmware for f in iteration.firmware_iterations]
-            _ = [c.config for c in iteration.config_iterations]
-            _ = iteration.unit_identity_confirmations
-            _ = [r.param_row for r in iteration.result_rows]
+            iteration_t, row_t = self._iteration_cla, LightingStation3ResultRow
+            iteration: LightingStation3Iteration = session.query(iteration_t).options(
+                joinedload(iteration_t.dut),
+                selectinload(iteration_t.firmware_iterations).joinedload(FirmwareIteration.firmware),
+                selectinload(iteration_t.config_iterations).joinedload(EEPROMConfigIteration.config),
+                selectinload(iteration_t.unit_identity_confirmations),
+                selectinload(iteration_t.result_rows).options(
+                    joinedload(row_t.param_row), selectinload(row_t.light_measurements),
+                ),
+            ).first()
             dut: LightingDUT = iteration.dut
             messages = [dut]
             for measurement in iteration.result_rows:  # type: LightingStation3ResultRow
@@ -137,32 +149,31 @@ class Controller(Process):
 
     @subscribe(GetMetricsMessage)
     def give_metrics(self) -> None:
-        response = MetricsMessage(0, 0, 0, 0)
-        midnight = datetime.datetime.combine(datetime.date.today(), datetime.datetime.min.time())
-        hour_ago = datetime.datetime.now() - datetime.timedelta(hours=1)
+        now = datetime.datetime.now()
+        midnight = now.replace(hour=0, minute=0, second=0, microsecond=0)
+        hour_ago = now - _ONE_HOUR
+        iteration = self._iteration_cla
+        in_hour = iteration.created_at >= hour_ago
         with self.session_manager() as session:
-            for result in session.query(
-                    self._iteration_cla
-            ).filter(self._iteration_cla.created_at >= midnight).all():
-                if result.pf:
-                    response.pass_day += 1
-                    if result.created_at >= hour_ago:
-                        response.pass_hour += 1
-                else:
-                    response.fail_day += 1
-                    if result.created_at >= hour_ago:
-                        response.fail_hour += 1
-            self.publish(response)
+            counts = session.query(
+                func.sum(case((and_(iteration.pf, in_hour), 1), else_=0)),
+                func.sum(case((iteration.pf, 0), (in_hour, 1), else_=0)),
+                func.sum(case((iteration.pf, 1), else_=0)),
+                func.sum(case((iteration.pf, 0), else_=1)),
+            ).filter(iteration.created_at >= midnight).one()
+            # SUM over no rows is NULL
+            self.publish(MetricsMessage(*(count or 0 for count in counts)))
 
     def is_cooldown_done(self, dut, cooldown_interval: float) -> bool:
         # TODO: format datetime in notification message
+        created_at = self._iteration_cla.created_at
         with self.session_manager() as session:
-            result = session.query(self._iteration_cla).filter_by(
+            last_created = session.query(created_at).filter_by(
                 dut_id=dut.id
-            ).order_by(self._iteration_cla.created_at).one_or_none()
-            if result is None:
+            ).order_by(created_at.desc()).limit(1).scalar()
+            if last_created is None:
                 return True
-            done_time = result.created_at + datetime.timedelta(seconds=cooldown_interval)
+            done_time = last_created + datetime.timedelta(seconds=cooldown_interval)
             if done_time > datetime.datetime.now():
                 self.publish(NotificationMessage(
                     'cooldown required', f'{dut.sn} may be tested at {done_time}'
@@ -178,12 +189,11 @@ class Controller(Process):
         Process.poll(self)
 
     def _handle_message(self, message, k: SubscribeTo) -> None:
-        method_name = self.subscribed_methods[k].get(type(message), None)
-        if method_name is not None:
-            method = getattr(self, method_name, None)
-            if callable(method):
-                args = asdict(message)
-                return method(**args)
+        entry = self._dispatch.get((k, message.__class__))
+        if entry is not None:
+            method, names = entry
+            # shallow: handlers get the message's own field values, not recursive copies
+            return method(*[getattr(message, name) for name in names])
         log.warning(f'{message} from {k} unhandled')
 
     def handle_message(self, message) -> None:
@@ -193,12 +203,19 @@ class Controller(Process):
         return self._handle_message(message, SubscribeTo.STATION)
 
     def publish(self, message) -> None:
-        log.info(f'sending {message}')
+        if log.isEnabledFor(logging.INFO):
+            log.info(f'sending {message}')
         self._q.put(message)
 
     def __post_init__(self):
         Process.__post_init__(self)
 
+        self._dispatch: Dict[Tuple[SubscribeTo, Type], Tuple[Callable, Tuple[str, ...]]] = {
+            (k, message_t): (getattr(self, method_name), tuple(f.name for f in fields(message_t)))
+            for k, methods in self.subscribed_methods.items()
+            for message_t, method_name in methods.items()
+        }
+
         self.is_testing = False
         self._station_mode = StationMode.TESTING
         self.session_manager = connect()
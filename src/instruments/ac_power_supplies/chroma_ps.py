@@ -1,15 +1,16 @@
 import csv
+import math
 from dataclasses import dataclass
 from dataclasses import fields
 from dataclasses import InitVar
 from dataclasses import MISSING
 from enum import auto
 from enum import Enum
-from operator import attrgetter
-from operator import is_
+from functools import lru_cache
 from typing import cast
 from typing import Dict
 from typing import Optional
+from typing import Tuple
 from typing import Type
 from typing import TypeVar
 from typing import Union
@@ -28,6 +29,7 @@ __all__ = [
 ]
 
 ARG_T = Union[str, int, float]
+_BUILD_CACHE_SIZE = 64
 
 
 class _Branch(Enum):
@@ -44,28 +46,45 @@ class ChromaPowerSupplyError(InstrumentError):
     pass
 
 
+@lru_cache(maxsize=None)
+def _field_names(cls: type, positional_only: bool = False) -> Tuple[str, ...]:
+    """
+    dataclass field names, computed once per message class
+    """
+    # SUPPRESS-LINTER <only used with dataclass subclasses of the message bases>
+    # noinspection PyDataclass
+    return tuple(f.name for f in fields(cls) if not positional_only or f.default is MISSING)
+
+
 class MeasurementMessage:
     # noinspection PyTypeChecker
     _T = TypeVar('_T', bound='MeasurementMessage')
 
     @classmethod
     def fulfill(cls: Type[_T], actor) -> _T:
+        """
+        chain every field's query into one packet; only the first takes a new measurement
+        """
         cla = type(actor)
-        positional = list(map(attrgetter('name'), filter(lambda f: is_(MISSING, f.default), fields(cls))))
-        return cls(**{k: getattr(actor, k).__get__(actor, cla)(  # type: ignore
-            new_measurement=not bool(i),
-        ) for i, k in enumerate(positional)})
+        names = _field_names(cls, True)
+        commands = [getattr(actor, k).__get__(actor, cla) for k in names]
+        actor.write(' ; '.join(command.query(not bool(i)) for i, command in enumerate(commands)))
+        replies = actor.read().split(';')
+        if len(replies) != len(commands):
+            raise ChromaPowerSupplyError(
+                f'{cls.__name__}: expected {len(commands)} replies, got {len(replies)}'
+            )
+        return cls(**{k: command.return_format(reply.strip())  # type: ignore
+                      for k, command, reply in zip(names, commands, replies)})
 
 
 class SettingMessage:
     def _prep(self, actor) -> None:
         if not hasattr(self, '_commands'):
             cls = type(actor)
-            # SUPPRESS-LINTER <this should only be used as a dataclass superclass>
-            # noinspection PyDataclass
-            _fields = list(map(attrgetter('name'), fields(self)))  # type: ignore
-            self._commands = [getattr(actor, k).__get__(actor, cls) for k in _fields]
-            self._args = [getattr(self, k) for k in _fields]
+            _fields = _field_names(type(self))
+            self._commands = tuple(getattr(actor, k).__get__(actor, cls) for k in _fields)
+            self._args = tuple(getattr(self, k) for k in _fields)
 
     def request(self, actor) -> None:
         self._prep(actor)
@@ -76,8 +95,19 @@ class SettingMessage:
         return [command.build(arg) for command, arg in zip(self._commands, self._args)]
 
     def verify(self, actor) -> None:
+        """
+        chain every setting's query into one packet and check the replies in order
+        """
         self._prep(actor)
-        [command.verify(arg, do_error=True) for command, arg in zip(self._commands, self._args)]
+        actor.write(' ; '.join(command.query_string for command in self._commands))
+        replies = actor.read().split(';')
+        if len(replies) != len(self._commands):
+            raise ChromaPowerSupplyError(
+                f'{type(self).__name__}: expected {len(self._commands)} replies, got {len(replies)}'
+            )
+        for command, arg, reply in zip(self._commands, self._args, replies):
+            if command.return_format(reply.strip()) != arg:
+                raise ChromaPowerSupplyError(f'{command}: failed to verify')
 
 
 @dataclass
@@ -177,7 +207,7 @@ class ChromaMeasurement(MeasurementMessage):
     def __post_init__(self) -> None:
         self.apparent_p = self.v_rms * self.i_rms
         self.true_p = self.apparent_p * self.pf
-        self.reactive_p = abs((self.apparent_p ** 2) - (self.true_p ** 2)) ** .5
+        self.reactive_p = math.sqrt(abs((self.apparent_p ** 2) - (self.true_p ** 2)))
         self.i_pk = self.i_rms * self.cf
         self.pdc = self.vdc * self.idc
 
@@ -286,13 +316,15 @@ class Setting(_CommandBase):
         if not (has_constraint ^ has_options):
             raise ValidationError(self.command_string)
         self.constraint = _Limits(float(min_val), float(max_val)) if has_constraint else None
-        self.options = set(options.split('-')) if has_options else None
+        self.options = frozenset(options.split('-')) if has_options else None
         # noinspection SpellCheckingInspection
         self._new_meas_string = self.command_string.replace('FETC', 'MEAS')
         self.argument_format = argument_format
         self.return_format = self.__return_types_d.get(argument_format[-1]) if argument_format else None
         self._last_value = None
         self.query_string = f'{self.command_string}?'
+        # fixed conditions (output off, general settings) reissue the same args every cycle
+        self.build = lru_cache(maxsize=_BUILD_CACHE_SIZE, typed=True)(self._build)
 
     @register.after('__set_name__')
     def _set_callback_name(self) -> None:
@@ -301,7 +333,7 @@ class Setting(_CommandBase):
             if not callable(getattr(self.owner, self.callback_name, None)):
                 raise ChromaPowerSupplyError(f'{self.owner} does not implement callback {self.callback_name}')
 
-    def build(self, arg: ARG_T) -> str:
+    def _build(self, arg: ARG_T) -> str:
         if self.constraint is not None and not self.constraint.check(cast(Union[int, float], arg)):
             raise ChromaPowerSupplyError(f'{self}: arg: <{arg}> failed validation')
         if self.options is not None and arg not in self.options:
@@ -346,11 +378,11 @@ class Measurement(_CommandBase):
         # noinspection SpellCheckingInspection
         self._new_meas_string = self.query_string.replace('FETC', 'MEAS')
 
+    def query(self, new_measurement: bool = False) -> str:
+        return self._new_meas_string if new_measurement else self.query_string
+
     def __call__(self, new_measurement: bool = False):
-        if new_measurement:
-            self._write_only(self._new_meas_string)
-        else:
-            self._write_only(self.query_string)
+        self._write_only(self.query(new_measurement))
         self.instance.info(f'{self}: requested')
         return self._read_only()
 
@@ -369,9 +401,12 @@ class Status(_CommandBase):
         super()._config_self(command_string, branch)
         self.query_string = f'{self.command_string}?'
 
-    def __call__(self, new_measurement: bool = False):
+    def query(self, new_measurement: bool = False) -> str:
         _ = new_measurement
-        self._write_only(self.query_string)
+        return self.query_string
+
+    def __call__(self, new_measurement: bool = False):
+        self._write_only(self.query(new_measurement))
         self.instance.info('reading status word')
         return self._read_only()
 
@@ -484,8 +519,7 @@ class ChromaPowerSupply(Serial):
     @proxy.exposed
     def setting(self, condition: Union[SettingMessage],
                 delay_override: float = None) -> None:
-        for command in condition.requests_in_series(self):
-            self.write(command)
+        condition.request(self)
         self._instrument_delay(delay_override or self.COMMAND_EXEC_WAIT_S)
         condition.verify(self)
 
@@ -516,20 +550,22 @@ class ChromaPowerSupply(Serial):
             raise ChromaPowerSupplyError(ntr)
 
     def _instrument_debug(self) -> None:
-        from time import perf_counter
+        from time import perf_counter_ns
+        _info = self.info
         for vdc in range(5, 15):
-            ti = perf_counter()
+            ti = perf_counter_ns()
             self.write_settings(float(vdc), 0., 60., 0.5)
-            self.info('settings', perf_counter() - ti)
-            ti = perf_counter()
+            _info(f'settings {(perf_counter_ns() - ti) / 1e6:.3f} ms')
+            ti = perf_counter_ns()
             self.output_enable()
-            self.info('output enable', perf_counter() - ti)
-            ti = perf_counter()
-            self.info(self.measure())
-            self.info('measure', perf_counter() - ti)
-            ti = perf_counter()
+            _info(f'output enable {(perf_counter_ns() - ti) / 1e6:.3f} ms')
+            ti = perf_counter_ns()
+            measurement = self.measure()
+            _info(f'measure {(perf_counter_ns() - ti) / 1e6:.3f} ms')
+            _info(measurement)
+            ti = perf_counter_ns()
             self.output_disable()
-            self.info('output disable', perf_counter() - ti)
+            _info(f'output disable {(perf_counter_ns() - ti) / 1e6:.3f} ms')
 
     @proxy.exposed
     def write_settings(self, vdc: float, vac: float, freq: float,
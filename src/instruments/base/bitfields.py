@@ -31,7 +31,7 @@ class StatusBit:
 
     def __set_name__(self, owner, name):
         bit = add_self_to_map(owner, _status_bits_list_key, name, self.bit, name)
-        setattr(owner, _word_val_key, getattr(owner, _word_val_key, 0) + 1 << bit)
+        setattr(owner, _word_val_key, getattr(owner, _word_val_key, 0) | (1 << bit))
         setattr(owner, name, None)
 
 
@@ -43,7 +43,8 @@ class BitField:
         def __post_init__(self, value: str = '') -> None:
             self._value = self._convert_input(value)
             bits = getattr(self, _status_bits_list_key)
-            [setattr(self, k, bool((self._value >> bit) & 1)) for bit, k in bits.items()]
+            for bit, k in bits.items():
+                setattr(self, k, bool((self._value >> bit) & 1))
 
         def __bool__(self) -> bool:
             return bool(self._value)
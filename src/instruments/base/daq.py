@@ -3,10 +3,11 @@ import re
 from enum import Enum
 from math import floor
 from time import time
-from typing import cast
+from typing import Callable
 from typing import Dict
 from typing import List
 from typing import Optional
+from typing import Tuple
 from typing import Type
 from typing import Union
 
@@ -56,6 +57,7 @@ class DAQTaskError(InstrumentError):
 
 
 _chassis_sn_key = '_chassis_sn_key_'
+_product_type_pattern = re.compile(r'^NI (\d{4})')
 
 
 class DAQChassis:
@@ -65,7 +67,7 @@ class DAQChassis:
         self.__class__._dev_d = _daq_devices_d = collections.defaultdict(dict)
         for _chassis in nidaqmx.system.system.System().devices:
             for _module in _chassis.chassis_module_devices:
-                _mn = int(re.findall(r'^NI (\d{4})', _module.product_type)[0])
+                _mn = int(_product_type_pattern.match(_module.product_type).group(1))
                 _slot = _module.compact_daq_slot_num - 1
                 _daq_devices_d[_chassis.dev_serial_num][(_slot, _mn)] = _module
 
@@ -201,10 +203,15 @@ class Channel(register.Mixin):
     channel_type: str  # ex: 'ai_channels' <- channel collection object attr k
     # noinspection SpellCheckingInspection
     channel_method: str  # ex: 'add_ai_voltage_chan' <- method to call on collection
+    scale_kwargs: Dict[str, Union[int, str]] = {}  # only passed as **kwargs, never mutated
 
-    def add_to_task(self) -> None:
-        method = getattr(getattr(self.task_instance.task, self.channel_type), self.channel_method)
-        method(self.identifier, **getattr(self, 'scale_kwargs', {}))
+    def add_to_task(self, method: Callable = None) -> None:
+        """
+        method is the collection's add method, which the task may resolve once for many channels
+        """
+        if method is None:
+            method = getattr(getattr(self.task_instance.task, self.channel_type), self.channel_method)
+        method(self.identifier, **self.scale_kwargs)
         self.task_instance.debug(f'{self} added to task')
 
     @check_for_required_attrs.declared_on_class(channel_type=str, channel_name=str, channel_method=str)
@@ -304,7 +311,13 @@ class DAQTask(Instrument):
 
     def _instrument_setup(self) -> None:
         self.task = nidaqmx.Task()
-        [ch.add_to_task() for ch in self.channels]
+        add_methods: Dict[Tuple[str, str], Callable] = {}
+        # declaration order is the task's channel order, so channels are added in it, not grouped by type
+        for ch in self.channels:
+            k = ch.channel_type, ch.channel_method
+            if k not in add_methods:
+                add_methods[k] = getattr(getattr(self.task, ch.channel_type), ch.channel_method)
+            ch.add_to_task(add_methods[k])
 
     def _instrument_cleanup(self) -> None:
         for op in ('stop', 'close'):
@@ -363,7 +376,7 @@ class AITask(DAQTask):
         self.num_samp = int(self.acquisition_length_in_seconds * self.acquisition_rate_in_hertz)
         self._acq_duration = 1 / self.num_samp
         self._next_read = time() + self._acq_duration
-        self._data = np.zeros(shape=(self.num_channels, self.num_samp), dtype=np.float_)
+        self._data = np.zeros(shape=(self.num_channels, self.num_samp), dtype=np.float64)
 
     @register.before('_start_task')
     def _task_setup(self):
@@ -424,15 +437,25 @@ class DOTask(DAQTask):
 
     channels: List[DOChannel]
     _write_list: List[bool]
+    _last_write: Optional[List[bool]] = None
+
+    @register.before('_instrument_setup')
+    def _forget_last_write(self) -> None:
+        """
+        line states are unknown until the new task's first write
+        """
+        self._last_write = None
 
     def __write(self, values: List[bool]) -> None:
         self.proxy_check_cancelled()
         if not hasattr(self, '_write_list'):
-            self._write_list = values
-        else:
+            self._write_list = list(values)
+        elif values is not self._write_list:
             self._write_list[:] = values
-        if self._should_be_open:
+        values = self._write_list
+        if self._should_be_open and values != self._last_write:
             self.task.write(values, auto_start=False)
+            self._last_write = values.copy()
             [setattr(ch, '_state', v) for ch, v in zip(self.channels, values)]
             self.debug(f'wrote {values}')
 
@@ -476,8 +499,14 @@ class DITask(DAQTask):
     @proxy.exposed
     def read(self) -> List[bool]:
         self.proxy_check_cancelled()
-        return cast(List[bool], list(zip(*self.task.read(number_of_samples_per_channel=1)))[0])
+        return [samples[0] for samples in self.task.read(number_of_samples_per_channel=1)]
 
     @proxy.exposed
     def read_as_int(self) -> int:
-        return int(''.join(str(int(v)) for v in self.read()), 2)
+        """
+        first channel is the most significant bit
+        """
+        value = 0
+        for state in self.read():
+            value = (value << 1) | bool(state)
+        return value
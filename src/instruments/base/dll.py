@@ -14,6 +14,17 @@ __all__ = [
 
 
 def load_dll(fp: Path) -> CDLL:
+    """
+    make the dll's own directory searchable for its dependencies while it loads
+    """
+    # SUPPRESS-LINTER <windows, python 3.8+ only>
+    # noinspection PyUnresolvedReferences
+    add_dll_directory = getattr(os, 'add_dll_directory', None)
+    if add_dll_directory is not None:
+        with add_dll_directory(str(fp.parent)):
+            return CDLL(str(fp))
+
+    # chdir is process-wide; only for interpreters without add_dll_directory
     _prev = os.getcwd()
     try:
         os.chdir(fp.parent)
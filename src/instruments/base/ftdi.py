@@ -5,14 +5,15 @@ from dataclasses import dataclass
 from enum import Enum
 from functools import reduce
 from operator import __or__
-from time import perf_counter, sleep, time
+from time import perf_counter, sleep
+from typing import Any
+from typing import Dict
 from typing import Optional
 from typing import Type
 
 import ftd2xx
 from ftd2xx.defines import DRIVER_TYPE_D2XX
 from ftd2xx.ftd2xx import DeviceError
-from funcy.seqs import chunks
 
 from src.instruments.base.instrument import Instrument
 
@@ -137,28 +138,23 @@ class FTDI:
     interface: Optional[ftd2xx.FTD2XX]
 
     CHROMA_STARTUP_S = .7
+    LATENCY_MS = 1  # D2XX default of 16ms dominates short reads
+    WRITE_CHUNK_BYTES = 64  # one full bulk-OUT packet; the 2 modem status bytes only ride on IN packets
+    TX_FIFO_BYTES = 256  # FT232R, the smallest tx buffer of the common single-channel parts
 
     def _getter(self, k: str):
-        v = getattr(self, f'__{k}', None)
+        v = self._cache.get(k)
         if v is not None:
             return v
         raise AttributeError(f'{k} not set')
 
-    def _setter(self, k: str, v) -> None:
-        setattr(self, f'__{k}', v)
-
     @_if_raise(DeviceError, FTDINotConnectedError)
     def _set_if_changed(self, f, k: str, v, *args) -> bool:
-        try:
-            value = self._getter(k)
-        except AttributeError:
-            pass
-        else:
-            if self._settings_changed[k]:
-                if value is not None and value == v:
-                    return True
+        value = self._cache.get(k)
+        if value is not None and self._settings_changed[k] and value == v:
+            return True
         f(*args)
-        self._setter(k, v)
+        self._cache[k] = v
         self._settings_changed[k] = True
         return False
 
@@ -179,9 +175,16 @@ class FTDI:
 
     @baudrate.setter
     def baudrate(self, rate: int) -> None:
-        self._set_if_changed(self.interface.setBaudRate, 'baudrate', rate, rate)
-        self.break_length = (self._break_bytes / self.baudrate) * self._word_length
-        self.mab_length = (self._mab_bytes / self.baudrate) * self._word_length
+        if not self._set_if_changed(self.interface.setBaudRate, 'baudrate', rate, rate):
+            self._update_frame_timing()
+
+    def _update_frame_timing(self) -> None:
+        try:
+            self._t_per_byte = self._word_length / self.baudrate
+            self.break_length = self._break_bytes * self._t_per_byte
+            self.mab_length = self._mab_bytes * self._t_per_byte
+        except AttributeError:
+            pass  # baudrate, word and packet are not all set yet
 
     @property
     def timeouts(self) -> Timeouts:
@@ -191,6 +194,14 @@ class FTDI:
     def timeouts(self, timeout: Timeouts) -> None:
         self._set_if_changed(self.interface.setTimeouts, 'timeouts', timeout, timeout.read, timeout.write)
 
+    @property
+    def latency_timer(self) -> int:
+        return self._getter('latency_timer')
+
+    @latency_timer.setter
+    def latency_timer(self, ms: int) -> None:
+        self._set_if_changed(self.interface.setLatencyTimer, 'latency_timer', ms, ms)
+
     @property
     def word(self) -> WordCharacteristics:
         return self._getter('word_characteristics')
@@ -201,10 +212,11 @@ class FTDI:
 
     @word.setter
     def word(self, settings: WordCharacteristics) -> None:
-        self._set_if_changed(
+        if not self._set_if_changed(
             self._set_word, 'word_characteristics', settings,
             settings.data_bits.value, settings.stop_bits.value, settings.parity.value
-        )
+        ):
+            self._update_frame_timing()
 
     @property
     def packet(self) -> PacketCharacteristics:
@@ -214,14 +226,9 @@ class FTDI:
     def packet(self, settings: PacketCharacteristics) -> None:
         self._break_bytes = settings.break_bytes
         self._mab_bytes = settings.mab_bytes
-        # try:
-        #     self.break_length = (self._break_bytes / self.baudrate) * self._word_length
-        #     print('in packet prop', self.break_length, self._break_bytes, self.baudrate, self._word_length)
-        #     self.mab_length = (self._mab_bytes / self.baudrate) * self._word_length
-        # except AttributeError:
-        #     pass
+        self._update_frame_timing()
         self._line_pause = settings.line_pause
-        self._setter('packet', settings)
+        self._cache['packet'] = settings
 
     @property
     def settings(self) -> Settings:
@@ -233,7 +240,7 @@ class FTDI:
         self.word = settings.word
         self.packet = settings.packet
         self.baudrate = settings.baudrate
-        self._setter('settings', settings)
+        self._cache['settings'] = settings
 
     def __str__(self) -> str:
         name = type(self).__name__
@@ -252,7 +259,8 @@ class FTDI:
         # noinspection PyProtectedMember
         self.delay_for = self.instrument._instrument_delay
         self.interface = None  # type: ignore
-        self.next_tx = time()
+        self.next_tx = perf_counter()
+        self._cache: Dict[str, Any] = {}
         self._settings_changed: defaultdict[str, bool] = defaultdict(lambda: False)
 
     def close(self) -> None:
@@ -279,8 +287,9 @@ class FTDI:
         except DeviceError as e:
             raise FTDINoCableError('No FTDI cable connected') from e
         else:
+            self.latency_timer = self.LATENCY_MS
             self.settings = settings
-            self.next_tx = time() + self.instrument.TX_WAIT_S
+            self.next_tx = perf_counter() + self.instrument.TX_WAIT_S
             self.baud = BaudrateContext(self)
 
     def open(self, settings: Settings) -> None:
@@ -298,47 +307,51 @@ class FTDI:
     @_if_raise(DeviceError, FTDINotConnectedError)
     def write(self, data: bytes) -> int:
         self.delay_for(0.)
-        _t_per_byte = self._word_length / self.baudrate
-        _chunks = list(chunks(64, data))
-        num_chunks = len(_chunks)
-        for i, chunk in enumerate(_chunks):
-            chunk_t = len(chunk) * _t_per_byte
-            if (i + 1) != num_chunks:
-                with TimerContext(chunk_t):
-                    self.interface.write(chunk)
-            else:
-                self.next_tx = time() + self.instrument.TX_WAIT_S + chunk_t
-                self.interface.write(chunk)
-        return len(data)
+        n, total = self.WRITE_CHUNK_BYTES, len(data)
+        if not total:
+            return 0
+        _t_per_byte = self._t_per_byte
+        mv = memoryview(data)
+        # a frame that fits in the chip's tx buffer goes out in one call; only longer ones are paced
+        last = 0 if total <= self.TX_FIFO_BYTES else total - (total % n or n)
+        chunk_t = n * _t_per_byte
+        for i in range(0, last, n):
+            t_next = perf_counter() + chunk_t
+            self.interface.write(bytes(mv[i:i + n]))
+            _sleep_until(t_next)
+        self.next_tx = perf_counter() + self.instrument.TX_WAIT_S + (total - last) * _t_per_byte
+        self.interface.write(bytes(mv[last:]))
+        return total
 
     @_if_raise(DeviceError, FTDINotConnectedError)
     def read(self, num_bytes: int) -> bytes:
         self.delay_for(0.)
         rx = self.interface.read(num_bytes, raw=True)
-        # self.next_tx = time() + self.instrument.TX_WAIT_S
+        # self.next_tx = perf_counter() + self.instrument.TX_WAIT_S
         self.instrument.debug(f'rx -> {rx}')
         return rx
 
     def flush(self) -> None:
-        while self.out_waiting:
-            self.delay_for(0.)
+        # sleep for the time the queued bytes need on the wire rather than re-polling getStatus
+        out_waiting = self.out_waiting
+        while out_waiting:
+            self.delay_for(out_waiting * self._t_per_byte)
+            out_waiting = self.out_waiting
 
     def send_break(self, duration: float) -> None:
         if duration:
             try:
-                # with TimerContext(duration):
                 self.break_condition = True
                 self.delay_for(duration)
             finally:
                 self.break_condition = False
 
     def clear_read_buffer(self) -> None:
+        # purge is one control transfer; no need to read out bytes nobody looks at
         for _ in range(3):
-            in_ = self.in_waiting
-            if in_:
-                self.read(in_)
-                continue
-            break
+            self._reset_buffers(BUFFER.RX)
+            if not self.in_waiting:
+                break
         else:
             raise FTDIError('continuous rx on FTDI')
 
@@ -363,15 +376,19 @@ class FTDI:
 
     def reset_input_buffer(self) -> None:
         self.clear_read_buffer()
-        self._reset_buffers(BUFFER.RX)
 
     def reset_output_buffer(self) -> None:
         self._reset_buffers(BUFFER.TX)
 
     @property
-    @_if_raise(DeviceError, FTDINotConnectedError)
     def status(self) -> Status:
-        return Status(*self.interface.getStatus())
+        # polled in tight loops; same checks as _if_raise without the extra wrapper frame
+        if self.interface is None:
+            raise FTDINotConnectedError('FTDI cable is not connected')
+        try:
+            return Status(*self.interface.getStatus())
+        except DeviceError:
+            raise FTDINotConnectedError('failed in status')
 
     @property
     def in_waiting(self) -> int:
@@ -385,35 +402,35 @@ class FTDI:
     def event_status(self) -> int:
         return self.status.status
 
-    def send(self, data: bytes) -> None:
-        self.delay_for(self.next_tx-time())
-        self.send_break(self.break_length)
-        with TimerContext(self.mab_length):
+    def send(self, data: bytes, reset_input: bool = True) -> None:
+        self.delay_for(self.next_tx-perf_counter())
+        # break and MAB are minimum holds, timed from when each control transfer returns
+        if self.break_length:
+            try:
+                self.break_condition = True
+                _sleep_until(perf_counter() + self.break_length)
+            finally:
+                self.break_condition = False
+        t_write = perf_counter() + self.mab_length
+        if reset_input:
             self.reset_input_buffer()
+        _sleep_until(t_write)
         self.write(data)
         self.instrument.debug(f'tx -> {data}')
 
     def send_ascii(self, data: str) -> None:
         with self.baud(9600):
-            for char in data:
+            # each char keeps its own break/MAB framing; the rx side only needs clearing once
+            for i, char in enumerate(data.encode()):
                 # sleep(.01)
-                self.send(char.encode())
+                self.send(bytes((char,)), reset_input=not i)
         self.instrument.debug(f'tx -> {data}')
         self.flush()
-        self.next_tx = time() + self.instrument.TX_WAIT_S
-
+        self.next_tx = perf_counter() + self.instrument.TX_WAIT_S
 
-class TimerContext:
-    _timer_f = time
-    def __init__(self, te: float) -> None:
-        self.te = te
 
-    def __enter__(self) -> 'TimerContext':
-        self.tf = self.te + self._timer_f()
-        return self
-
-    def __exit__(self, *args):
-        sleep(max(0., self.tf - self._timer_f()))
+def _sleep_until(t: float) -> None:
+    sleep(max(0., t - perf_counter()))
 
 
 class BaudrateContext:
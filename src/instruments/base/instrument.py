@@ -1,6 +1,8 @@
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from functools import wraps
 from inspect import currentframe
-from itertools import count
+from operator import methodcaller
 from time import sleep
 from time import time
 from typing import Callable
@@ -38,6 +40,14 @@ class InstrumentError(Exception):
 # noinspection PyTypeChecker
 _T = TypeVar('_T', bound='Instrument')
 _test_instruments_key = '_test_instrument_key_'
+_DELAY_POLL_S = .05
+
+
+def _driver_of(inst: 'Instrument') -> type:
+    """
+    the base class in this package an instrument is built on, e.g. Serial or VISA
+    """
+    return next((c for c in type(inst).__mro__ if c.__module__.startswith(__package__)), type(inst))
 
 
 def instrument_debug(cls: Type[_T]) -> Optional[Type[_T]]:
@@ -81,13 +91,15 @@ class Instrument(Logged, proxy.Mixin, register.Mixin):
     def _instrument_delay(self, te: float) -> None:
         if te > 0.:
             tf = time() + te
-            for _ in count():
+            # block on the first check flag so cancellation wakes the delay immediately
+            wait = self._instrument_check_flags[0].wait if self._instrument_check_flags else sleep
+            while True:
                 self.proxy_check_cancelled()
                 self.instrument_check_flags()
                 t = time()
                 if t > tf:
                     break
-                sleep(max(0., min(.001, tf - t)))
+                wait(max(0., min(_DELAY_POLL_S, tf - t)))
 
     def _instrument_setup(self) -> None:
         """
@@ -199,6 +211,10 @@ class StringInstrument(Instrument):
     ENCODING: str
     TERM_CHAR: str
 
+    @register.before('_instrument_setup')
+    def _encode_term_char(self) -> None:
+        self._term_bytes = self.TERM_CHAR.encode(self.ENCODING)
+
     def _instrument_setup(self) -> None:
         raise NotImplementedError
 
@@ -212,7 +228,7 @@ class StringInstrument(Instrument):
         raise NotImplementedError
 
     def _prep_command(self, data: str) -> bytes:
-        return f'{data}{self.TERM_CHAR}'.encode(self.ENCODING)
+        return data.encode(self.ENCODING) + self._term_bytes
 
     def _strip_command(self, data: bytes) -> str:
         return data.decode(self.ENCODING).strip()
@@ -273,13 +289,33 @@ class InstrumentHandler(Logged, proxy.Mixin, register.Mixin):
         self.__instrument('instrument_add_check_flag', self.proxy_cancel_flag)
 
     def __instrument(self, method_name: str, *args, **kwargs) -> None:
-        results = [getattr(inst, method_name)(*args, **kwargs) for inst in self.instruments.values()]
-        [r.resolve() if isinstance(r, proxy.Promise) else r for r in results]
+        call = methodcaller(method_name, *args, **kwargs)
+        # issue every call before resolving any so proxied instruments run concurrently
+        results = [call(inst) for inst in self.instruments.values()]
+        for r in results:
+            if isinstance(r, proxy.Promise):
+                r.resolve()
+
+    def __instrument_concurrently(self, method_name: str) -> None:
+        """
+        for blocking per-device work on joined instruments
+        instruments built on the same driver run one after another; only different drivers overlap
+        """
+        groups: Dict[type, List[Instrument]] = defaultdict(list)
+        for inst in self.instruments.values():
+            groups[_driver_of(inst)].append(inst)
+        if len(groups) > 1:
+            call = methodcaller(method_name)
+            with ThreadPoolExecutor(max_workers=len(groups)) as executor:
+                list(executor.map(lambda group: [call(inst) for inst in group], groups.values()))
+        else:
+            self.__instrument(method_name)
 
     def __proxy(self, method_name: str) -> None:
-        names, instruments = list(zip(*self.instruments.items()))
-        [setattr(self, k, getattr(v, method_name)()) for k, v in zip(names, instruments)]
-        self.instruments = {k: getattr(self, k) for k in names}
+        call = methodcaller(method_name)
+        for k, v in self.instruments.items():
+            setattr(self, k, call(v))
+        self.instruments = {k: getattr(self, k) for k in self.instruments}
         self.instruments_spawned = 'spawn' in method_name
         self.info(f'performed {method_name}')
 
@@ -292,11 +328,11 @@ class InstrumentHandler(Logged, proxy.Mixin, register.Mixin):
     @register.before('instruments_setup')
     @instruments_joined
     def _instruments_setup(self) -> None:
-        self.__instrument('instrument_setup')
+        self.__instrument_concurrently('instrument_setup')
 
     @instruments_joined
     def instruments_cleanup(self) -> None:
-        self.__instrument('instrument_cleanup')
+        self.__instrument_concurrently('instrument_cleanup')
 
     def instruments_spawn(self) -> None:
         self.__proxy('proxy_spawn')
@@ -1,5 +1,9 @@
+from threading import Lock
+from time import perf_counter
 from typing import Callable
+from typing import List
 from typing import Optional
+from typing import Tuple
 
 import serial
 from serial.serialutil import SerialException
@@ -12,6 +16,24 @@ __all__ = [
     'Serial',
 ]
 
+_COMPORTS_TTL_S = 5.
+_comports_lock = Lock()
+_comports_cache: Tuple[float, List[ListPortInfo]] = (float('-inf'), [])
+
+
+def _comports() -> List[ListPortInfo]:
+    """
+    port enumeration is slow; instruments set up back to back share one scan
+    """
+    global _comports_cache
+    with _comports_lock:
+        t = perf_counter()
+        ts, ports = _comports_cache
+        if t - ts > _COMPORTS_TTL_S:
+            ports = comports()
+            _comports_cache = t, ports
+        return ports
+
 
 class Serial(StringInstrument):
     def _instrument_check(self) -> None:
@@ -38,7 +60,7 @@ class Serial(StringInstrument):
 
     def __find_fd(self) -> None:
         find_function = self.__make_find_func()
-        for comport in comports():
+        for comport in _comports():
             self.info(comport.hwid, comport.description)
             if find_function(comport):
                 self.debug(f'{comport.description} | {comport.hwid} | {comport.device}')
@@ -1,5 +1,7 @@
 from socket import AF_INET
+from socket import IPPROTO_TCP
 from socket import SOCK_STREAM
+from socket import TCP_NODELAY
 from socket import socket
 from socket import timeout
 
@@ -34,6 +36,7 @@ class TCPIP(StringInstrument):
 
     def _instrument_setup(self) -> None:
         self.interface = socket(AF_INET, SOCK_STREAM)
+        self.interface.setsockopt(IPPROTO_TCP, TCP_NODELAY, 1)
         self.interface.connect((self.IP_ADDRESS, self.PORT))
         self.interface.settimeout(self.TIMEOUT)
         self.__make_socket_fd()
@@ -42,7 +45,7 @@ class TCPIP(StringInstrument):
         self.interface.close()
 
     def _send(self, data: str) -> None:
-        self.interface.send(self._prep_command(data))
+        self.interface.sendall(self._prep_command(data))
 
     def _receive(self, **kwargs) -> str:  # type: ignore
         try:
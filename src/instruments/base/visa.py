@@ -1,4 +1,6 @@
+import re
 from time import time
+from typing import List
 
 import pyvisa
 
@@ -9,6 +11,9 @@ __all__ = [
     'VISA',
 ]
 
+# replies to a compound query are ';' separated, values within each reply ',' separated
+_reply_separator = re.compile(r'[,;]')
+
 
 class VISA(Instrument):
     def _instrument_check(self) -> None:
@@ -33,15 +38,29 @@ class VISA(Instrument):
     def _instrument_cleanup(self) -> None:
         self.interface.close()
 
-    def read(self, packet: str):
+    def query(self, packet: str, **kwargs) -> List[float]:
+        """
+        paced like write since the query carries the command to the instrument
+        """
         self.proxy_check_cancelled()
+        self._instrument_delay(self._next_tx - time())
+        self.debug(f'transmit -> "{packet}"')
         # noinspection PyUnresolvedReferences
-        rx = self.interface.query_ascii_values(packet, converter='f')  # type: ignore
-        if len(rx) == 1:
-            rx = rx[0]
+        rx = self.interface.query_ascii_values(packet, converter='f', **kwargs)  # type: ignore
+        self.set_next_tx_time()
         self.debug(f'receive -> "{rx}"')
         return rx
 
+    def read(self, packet: str):
+        rx = self.query(packet)
+        return rx[0] if len(rx) == 1 else rx
+
+    def read_many(self, *packets: str) -> List[float]:
+        """
+        sends the queries as one compound command; one round trip instead of one per query
+        """
+        return self.query(';'.join(packets), separator=_reply_separator.split)
+
     def write(self, packet: str) -> None:
         self._instrument_delay(self._next_tx - time())
         # noinspection PyUnresolvedReferences
@@ -1,3 +1,8 @@
+from contextlib import contextmanager
+from typing import Callable
+from typing import Iterator
+from typing import List
+
 from simple_pyspin import Camera as Spinnaker
 
 from base.concurrency import proxy
@@ -37,6 +42,19 @@ class Camera(Instrument):
         self.interface.ExposureAuto = 'Off'
         self.interface.ExposureMode = 'Timed'
         self.interface.ExposureTime = self.EXPOSURE_TIME_US
+        self.interface.AcquisitionMode = 'Continuous'
+
+    @contextmanager
+    def streaming(self) -> Iterator[Callable]:
+        """
+        keeps acquisition running across frames
+        yields a function that grabs the next frame
+        """
+        self.interface.start()
+        try:
+            yield self.interface.get_array
+        finally:
+            self.interface.stop()
 
     @proxy.exposed
     def capture(self):
@@ -44,10 +62,16 @@ class Camera(Instrument):
         takes 212ms including start and stop
         this camera model is specced as 7.5FPS
         """
-        self.interface.start()
-        img = self.interface.get_array()
-        self.interface.stop()
-        return img
+        with self.streaming() as snap:
+            return snap()
+
+    @proxy.exposed
+    def capture_many(self, n: int) -> List:
+        """
+        pays for start and stop once for all n frames
+        """
+        with self.streaming() as snap:
+            return [snap() for _ in range(n)]
 
     def _instrument_check(self) -> None:
         _ = self.interface.initialized
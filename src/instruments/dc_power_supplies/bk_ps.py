@@ -48,7 +48,7 @@ class BKPowerSupply(VISA, _DCPowerSupply):
     class __Command:
         RESET = '*RST'
         SETUP = '*ESE 60;*SRE 48;*CLS'
-        IS_DONE = '*OPC? '
+        IS_DONE = '*OPC?'
         SET_VALUES = 'APPL %.6f,%.6f'
         GET_VALUES = 'APPL?'
         SET_OUTPUT = 'OUTP %d'
@@ -63,7 +63,9 @@ class BKPowerSupply(VISA, _DCPowerSupply):
         self.read(self.__Command.GET_VOLT)
 
     def __command(self, packet: str) -> None:
-        self.write(packet)
+        # the trailing *OPC? makes the command and its completion check one round trip
+        if self.read(f'{packet};{self.__Command.IS_DONE}'):
+            return
         command_timeout = self.COMMAND_EXECUTION_TIMEOUT + time()
         while command_timeout > time():
             if self.read(self.__Command.IS_DONE):
@@ -84,10 +86,13 @@ class BKPowerSupply(VISA, _DCPowerSupply):
     def _bk_cleanup(self) -> None:
         self.write_settings(DCLevel(0., 0.), False)
 
+    def __read_state(self) -> Tuple[DCLevel, bool]:
+        v, a, output_state = self.read_many(self.__Command.GET_VALUES, self.__Command.GET_OUTPUT)
+        return DCLevel(v, a), bool(output_state)
+
     @proxy.exposed
     def read_settings(self) -> Tuple[DCLevel, bool]:
-        return DCLevel(*self.read(self.__Command.GET_VALUES)), \
-               bool(self.read(self.__Command.GET_OUTPUT))
+        return self.__read_state()
 
     @proxy.exposed
     def set_settings(self, dc_level: DCLevel) -> None:
@@ -110,14 +115,16 @@ class BKPowerSupply(VISA, _DCPowerSupply):
         if dc_level is None and output_state is None:
             raise BKPowerSupplyError('must call .write_settings() with at least one arg')
 
-        was_dc_level_correct = (dc_level is None) or (dc_level == self.get_settings())
+        dc_level_now, output_state_now = self.__read_state()
+
+        was_dc_level_correct = (dc_level is None) or (dc_level == dc_level_now)
         if was_dc_level_correct:
             if dc_level is not None:
                 self.info(f'power settings = {dc_level}')
         else:
             self.set_settings(dc_level)
 
-        was_output_state_correct = (output_state is None) or not (output_state ^ self.get_output())
+        was_output_state_correct = (output_state is None) or not (output_state ^ output_state_now)
         if was_output_state_correct:
             if output_state is not None:
                 self.info(f'output state = {output_state}')
@@ -126,14 +133,17 @@ class BKPowerSupply(VISA, _DCPowerSupply):
 
         error_strings = []
 
+        if not (was_dc_level_correct and was_output_state_correct):
+            dc_level_now, output_state_now = self.__read_state()
+
         if not was_dc_level_correct:
-            if self.get_settings() != dc_level:
+            if dc_level_now != dc_level:
                 error_strings.append(dc_level)
             else:
                 self.info(f'power settings = {dc_level}')
 
         if not was_output_state_correct:
-            if self.get_output() ^ cast(bool, output_state):
+            if output_state_now ^ cast(bool, output_state):
                 error_strings.append(f'output_enable={output_state}')
             else:
                 self.info(f'output state = {output_state}')
@@ -153,7 +163,7 @@ class BKPowerSupply(VISA, _DCPowerSupply):
         if fresh:
             self._instrument_delay(self.next_meas - time())
             self.next_meas = time() + self.MEASUREMENT_WAIT
-        meas = DCLevel(*list(map(self.read, [self.__Command.GET_VOLT, self.__Command.GET_CURR])))
+        meas = DCLevel(*self.read_many(self.__Command.GET_VOLT, self.__Command.GET_CURR))
         self.info(meas, f'fresh={fresh}')
         return meas
 
@@ -5,14 +5,21 @@ from typing import TypeVar
 from urllib.parse import quote_plus
 
 from typing import Type
+from sqlalchemy import case
+from sqlalchemy import cast
+from sqlalchemy import func
+from sqlalchemy import literal
+from sqlalchemy import String
 from sqlalchemy import Table
 from sqlalchemy.engine.default import DefaultExecutionContext
+from sqlalchemy.sql import ColumnElement
 
 __all__ = [
     'make_hash',
     'make_hash_f',
     'password',
     'dataclass_to_model',
+    'zero_padded',
 ]
 
 
@@ -33,3 +40,17 @@ _T = TypeVar('_T', bound=Table)
 
 def dataclass_to_model(dc: dataclass, model: Type[_T], **kwargs) -> _T:
     return model(**{k.name: getattr(dc, k.name) for k in fields(dc)}, **kwargs)
+
+
+def zero_padded(expression, width: int) -> ColumnElement:
+    """
+    SQL for str(expression).zfill(width) on non-negative ints
+    sqlite has no lpad or right() so this sticks to substr, length, and ||
+    values already width or wider are returned whole, as zfill does
+    """
+    text = cast(expression, String)
+    padded = literal('0' * width) + text
+    return case(
+        (func.length(text) < width, func.substr(padded, func.length(padded) - (width - 1))),
+        else_=text,
+    )
@@ -19,8 +19,10 @@ from typing import Union
 import funcy
 from sqlalchemy import Column
 from sqlalchemy import func
+from sqlalchemy import literal
 from sqlalchemy import UniqueConstraint
 from sqlalchemy.ext.declarative import DeclarativeMeta
+from sqlalchemy.orm import column_property
 from sqlalchemy.orm import joinedload
 from sqlalchemy.sql.selectable import ScalarSelect
 from sqlalchemy.sql.sqltypes import Boolean
@@ -35,6 +37,7 @@ from sqlalchemy.sql.sqltypes import Text
 from src.base.db.connection import SessionType
 from src.base.db.meta import *
 from src.model.configuration import get_configs_on_object
+from src.model.db.helper import zero_padded
 from src.model.enums import *
 
 __all__ = [
@@ -178,6 +181,8 @@ class LightingDUT(Schema):
     sn = Column(Integer, nullable=False)
     mn = Column(Integer, nullable=False)
     option = Column(String(128), nullable=True)
+    mn_formatted = column_property(literal('10-') + zero_padded(mn, 5))
+    sn_formatted = column_property(zero_padded(sn, 8))
     lighting_station3_iterations = Rel.lighting_dut_station3_iterations.parent
 
     @classmethod
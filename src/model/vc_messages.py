@@ -114,6 +114,7 @@ class StepMinorTextMessage:
 
 @dataclass
 class StepProgressMessage:
+    __slots__ = ('k', 'value')
     k: int
     value: Union[int, float]
 
@@ -131,6 +132,7 @@ class HistoryGetAllMessage:
 
 @dataclass
 class HistoryAddEntryMessage:
+    __slots__ = ('id', 'pf', 'dt', 'mn', 'sn')
     id: int
     pf: bool
     dt: datetime
@@ -63,6 +63,9 @@ class Station3(TestStation):
     lm = LightMeter()
     ftdi = RS485()
 
+    # the only throttle on firmware progress; the controller forwards every message it is given
+    FIRMWARE_PROGRESS_STRIDE = 10
+
     _config = configuration.from_yml(r'lighting\station3\station.yml')
     light_meter_calibration_interval_hours = _config.field(int)
     power_supply_log_level = _config.field(int, transform=configuration.log_level)
@@ -244,13 +247,14 @@ class Station3(TestStation):
                 if not self.ftdi.dta_erase_and_confirm().resolve():
                     raise TestFailure('failed to confirm FW erasure', _test_step_k)
 
-                self.emit(StepStartMessage(
-                    k=_test_step_k, minor_text='write', max_val=len(self.model.firmware_object.code)
-                ))
-                _emit = self.emit
+                _num_packets = len(self.model.firmware_object.code)
+                self.emit(StepStartMessage(k=_test_step_k, minor_text='write', max_val=_num_packets))
+                _emit, _stride = self.emit, self.FIRMWARE_PROGRESS_STRIDE
 
                 def consumer(message: FirmwareIncrement) -> None:
-                    _emit(StepProgressMessage(k=_test_step_k, value=message.i))
+                    # progress is absolute, so intermediate packets can be dropped
+                    if not message.i % _stride or message.i == _num_packets:
+                        _emit(StepProgressMessage(k=_test_step_k, value=message.i))
 
                 # noinspection PyNoneFunctionAssignment
                 programming_promise = self.ftdi.dta_program_firmware(
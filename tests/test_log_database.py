@@ -0,0 +1,47 @@
+import collections
+import datetime
+import logging
+
+from src.base.db.connection import connect
+from src.base.log import schema
+from src.base.log.objects import Handler
+
+
+def _record(i: int) -> logging.LogRecord:
+    record = logging.LogRecord('app.test', logging.INFO, __file__, i, 'message %d', (i,), None)
+    record.created_dt = datetime.datetime.fromtimestamp(record.created)
+    return record
+
+
+def _make_handler(session_manager, session_id: int) -> Handler.Database:
+    # Database.__init__ reads app config, so wire up the parts flush_cache_to_db uses by hand
+    handler = Handler.Database.__new__(Handler.Database)
+    logging.Handler.__init__(handler)
+    handler._session_manager = session_manager
+    handler._log, handler._log_record = schema.Log, schema.LogRecord
+    handler._id = session_id
+    handler._cache_max_time_s = 60.
+    handler._records = collections.deque()
+    handler.clear_cache()
+    return handler
+
+
+def test_flush_deque_backed_cache():
+    session_manager = connect(logging.getLogger, schema.Schema, conn_string='sqlite://')
+    with session_manager() as session:
+        log = session.make(schema.Log(
+            hostname='pc', human_readable='pc', last_commit='0' * 40, build_id=1, build_type='dev', v='0.0.0',
+        ))
+        session_id = log.id
+
+    handler = _make_handler(session_manager, session_id)
+    for i in range(2500):  # more than one bulk_insert batch
+        handler.add_record_to_cache(_record(i))
+    handler.flush_cache_to_db()
+
+    assert not handler._records and handler._cache_size == 0
+    with session_manager() as session:
+        rows = session.query(schema.LogRecord).order_by(schema.LogRecord.lineno).all()
+        assert len(rows) == 2500
+        assert {row.session_id for row in rows} == {session_id}
+        assert rows[-1].msg == 'message %d' and rows[-1].lineno == 2499